@@ -0,0 +1,92 @@
+-- ============================================
+-- Crime Lab - Match Statistics Upgrade
+-- Adds match_history.station and the match_stats_* counter tables
+-- used by /api/stats, then rebuilds the counters from match_history.
+--
+-- Fresh installs get all of this from schema.sql. On an existing
+-- database run this BEFORE starting the new app.py (/api/log-match
+-- writes to these tables). Safe to re-run: re-run it after deleting
+-- a suspect to resync the confidence histogram and hourly totals.
+-- ============================================
+
+USE crime_lab;
+
+-- Station that logged each match (existing rows become 'default')
+SET @has_station = (
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = 'crime_lab'
+       AND TABLE_NAME = 'match_history'
+       AND COLUMN_NAME = 'station'
+);
+SET @add_station = IF(@has_station = 0,
+    'ALTER TABLE match_history ADD COLUMN station VARCHAR(64) NOT NULL DEFAULT ''default'' AFTER confidence_score',
+    'DO 0');
+PREPARE stmt FROM @add_station;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- Per-suspect totals (leaderboard)
+CREATE TABLE IF NOT EXISTS match_stats_suspect (
+    suspect_id INT PRIMARY KEY,
+    match_count INT NOT NULL DEFAULT 0,
+    confidence_sum BIGINT NOT NULL DEFAULT 0,
+    confidence_min INT,
+    confidence_max INT,
+    last_confidence INT,
+    last_matched_at TIMESTAMP NULL,
+    INDEX idx_match_count (match_count),
+    FOREIGN KEY (suspect_id) REFERENCES suspects(id) ON DELETE CASCADE
+);
+
+-- Confidence histogram on the sensor's 0-255 scale
+-- bucket = LEAST(confidence, 255) DIV 16 (16 buckets: 0-15, ... 240-255)
+-- Not cleaned up when a suspect is deleted (re-run this script)
+CREATE TABLE IF NOT EXISTS match_stats_confidence (
+    bucket TINYINT UNSIGNED PRIMARY KEY,
+    match_count INT NOT NULL DEFAULT 0
+);
+
+-- Per-station hourly scan volume
+-- Not cleaned up when a suspect is deleted (re-run this script)
+CREATE TABLE IF NOT EXISTS match_stats_hourly (
+    station VARCHAR(64) NOT NULL,
+    hour_start DATETIME NOT NULL,
+    match_count INT NOT NULL DEFAULT 0,
+    confidence_sum BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (station, hour_start),
+    INDEX idx_hour_start (hour_start)
+);
+
+-- ============================================
+-- Rebuild counters from match_history
+-- ============================================
+START TRANSACTION;
+
+DELETE FROM match_stats_suspect;
+DELETE FROM match_stats_confidence;
+DELETE FROM match_stats_hourly;
+
+INSERT INTO match_stats_suspect
+    (suspect_id, match_count, confidence_sum, confidence_min, confidence_max,
+     last_confidence, last_matched_at)
+SELECT mh.suspect_id, COUNT(*), SUM(mh.confidence_score),
+       MIN(mh.confidence_score), MAX(mh.confidence_score),
+       (SELECT confidence_score FROM match_history
+         WHERE suspect_id = mh.suspect_id
+         ORDER BY matched_at DESC, id DESC LIMIT 1),
+       MAX(mh.matched_at)
+  FROM match_history mh
+ GROUP BY mh.suspect_id;
+
+INSERT INTO match_stats_confidence (bucket, match_count)
+SELECT LEAST(confidence_score, 255) DIV 16, COUNT(*)
+  FROM match_history
+ GROUP BY LEAST(confidence_score, 255) DIV 16;
+
+INSERT INTO match_stats_hourly (station, hour_start, match_count, confidence_sum)
+SELECT station, DATE_FORMAT(matched_at, '%Y-%m-%d %H:00:00'),
+       COUNT(*), SUM(confidence_score)
+  FROM match_history
+ GROUP BY station, DATE_FORMAT(matched_at, '%Y-%m-%d %H:00:00');
+
+COMMIT;
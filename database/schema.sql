@@ -30,6 +30,7 @@ CREATE TABLE IF NOT EXISTS match_history (
     id INT PRIMARY KEY AUTO_INCREMENT,
     suspect_id INT NOT NULL,
     confidence_score INT NOT NULL,
+    station VARCHAR(64) NOT NULL DEFAULT 'default', -- scanning station that logged the match
     matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (suspect_id) REFERENCES suspects(id) ON DELETE CASCADE
 );
@@ -138,3 +139,64 @@ CREATE TABLE IF NOT EXISTS gsr_sessions (
 -- Optional: add instantaneous GSR value to match_history at match time
 -- Uncomment to enable if desired
 -- ALTER TABLE match_history ADD COLUMN gsr_reading INT;
+
+-- ============================================
+-- Match Statistics - Incremental Counters
+-- Updated by /api/log-match in the same transaction as the
+-- match_history insert, so /api/stats reads never scan history.
+-- Existing databases: run database/migrate_match_stats.sql instead
+-- ============================================
+
+-- Per-suspect totals (leaderboard)
+CREATE TABLE IF NOT EXISTS match_stats_suspect (
+    suspect_id INT PRIMARY KEY,
+    match_count INT NOT NULL DEFAULT 0,
+    confidence_sum BIGINT NOT NULL DEFAULT 0,
+    confidence_min INT,
+    confidence_max INT,
+    last_confidence INT,
+    last_matched_at TIMESTAMP NULL,
+    INDEX idx_match_count (match_count),
+    FOREIGN KEY (suspect_id) REFERENCES suspects(id) ON DELETE CASCADE
+);
+
+-- Confidence histogram on the sensor's 0-255 scale
+-- bucket = LEAST(confidence, 255) DIV 16 (16 buckets: 0-15, ... 240-255)
+CREATE TABLE IF NOT EXISTS match_stats_confidence (
+    bucket TINYINT UNSIGNED PRIMARY KEY,
+    match_count INT NOT NULL DEFAULT 0
+);
+
+-- Per-station hourly scan volume
+CREATE TABLE IF NOT EXISTS match_stats_hourly (
+    station VARCHAR(64) NOT NULL,
+    hour_start DATETIME NOT NULL,
+    match_count INT NOT NULL DEFAULT 0,
+    confidence_sum BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (station, hour_start),
+    INDEX idx_hour_start (hour_start)
+);
+
+-- Seed counters from the sample match history
+INSERT INTO match_stats_suspect
+    (suspect_id, match_count, confidence_sum, confidence_min, confidence_max,
+     last_confidence, last_matched_at)
+SELECT mh.suspect_id, COUNT(*), SUM(mh.confidence_score),
+       MIN(mh.confidence_score), MAX(mh.confidence_score),
+       (SELECT confidence_score FROM match_history
+         WHERE suspect_id = mh.suspect_id
+         ORDER BY matched_at DESC, id DESC LIMIT 1),
+       MAX(mh.matched_at)
+  FROM match_history mh
+ GROUP BY mh.suspect_id;
+
+INSERT INTO match_stats_confidence (bucket, match_count)
+SELECT LEAST(confidence_score, 255) DIV 16, COUNT(*)
+  FROM match_history
+ GROUP BY LEAST(confidence_score, 255) DIV 16;
+
+INSERT INTO match_stats_hourly (station, hour_start, match_count, confidence_sum)
+SELECT station, DATE_FORMAT(matched_at, '%Y-%m-%d %H:00:00'),
+       COUNT(*), SUM(confidence_score)
+  FROM match_history
+ GROUP BY station, DATE_FORMAT(matched_at, '%Y-%m-%d %H:00:00');
@@ -25,6 +25,9 @@ BAUD_RATE = 9600
 # Flask server URL
 FLASK_URL = "http://localhost:5001"
 
+# Name of this scanning station (used for per-station match statistics)
+STATION_ID = "default"
+
 # ============================================
 # Functions
 # ============================================
@@ -67,7 +70,8 @@ def log_match(suspect_id, confidence):
             f"{FLASK_URL}/api/log-match",
             json={
                 "suspect_id": suspect_id,
-                "confidence": confidence
+                "confidence": confidence,
+                "station": STATION_ID
             },
             timeout=5
         )
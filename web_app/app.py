@@ -6,7 +6,7 @@ Real-time fingerprint match dossier display system
 from flask import Flask, render_template, jsonify, request
 from flask_socketio import SocketIO, emit
 import mysql.connector
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import json
 
@@ -24,6 +24,13 @@ DB_CONFIG = {
     'database': 'crime_lab'
 }
 
+# ============================================
+# Match Statistics Configuration
+# ============================================
+CONFIDENCE_MAX = 255         # Sensor confidence scale is 0-255
+CONFIDENCE_BUCKET_WIDTH = 16  # 16 histogram buckets across the scale
+DEFAULT_STATION = 'default'
+
 def get_db_connection():
     """Create and return a database connection"""
     try:
@@ -129,16 +136,28 @@ def get_suspect_data(suspect_id):
 @app.route('/api/log-match', methods=['POST'])
 def log_match():
     """
-    Log a fingerprint match event
-    Expected JSON: {"suspect_id": 1, "confidence": 225}
+    Log a fingerprint match event and update the match statistics counters
+    Expected JSON: {"suspect_id": 1, "confidence": 225, "station": "lab-1"}
+    ("station" is optional)
     """
     data = request.get_json()
     
     if not data or 'suspect_id' not in data or 'confidence' not in data:
         return jsonify({'error': 'Missing suspect_id or confidence'}), 400
     
-    suspect_id = data['suspect_id']
-    confidence = data['confidence']
+    suspect_id = parse_int_field(data['suspect_id'])
+    confidence = parse_int_field(data['confidence'])
+    if suspect_id is None or confidence is None:
+        return jsonify({'error': 'Invalid suspect_id or confidence'}), 400
+    if confidence < 0:
+        return jsonify({'error': 'Confidence must not be negative'}), 400
+    
+    station = data.get('station')
+    if station is None:
+        station = DEFAULT_STATION
+    elif not isinstance(station, str):
+        return jsonify({'error': 'Invalid station'}), 400
+    station = station.strip()[:64] or DEFAULT_STATION
     
     conn = get_db_connection()
     if not conn:
@@ -149,9 +168,11 @@ def log_match():
     try:
         # Insert match record
         cursor.execute("""
-            INSERT INTO match_history (suspect_id, confidence_score) 
-            VALUES (%s, %s)
-        """, (suspect_id, confidence))
+            INSERT INTO match_history (suspect_id, confidence_score, station) 
+            VALUES (%s, %s, %s)
+        """, (suspect_id, confidence, station))
+        
+        update_match_stats(cursor, suspect_id, confidence, station)
         
         conn.commit()
         
@@ -177,6 +198,58 @@ def log_match():
         conn.close()
         return jsonify({'error': str(err)}), 500
 
+def parse_int_field(value):
+    """
+    Parse an integer JSON field, accepting ints and integer strings only.
+    Returns None for floats, booleans and anything else.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+def confidence_bucket(confidence):
+    """Map a confidence score to its histogram bucket (scores above 255 go in the top bucket)"""
+    confidence = min(max(confidence, 0), CONFIDENCE_MAX)
+    return confidence // CONFIDENCE_BUCKET_WIDTH
+
+def update_match_stats(cursor, suspect_id, confidence, station):
+    """
+    Increment the match statistics counters for one match.
+    Runs on the caller's cursor so the counters commit (or roll back)
+    together with the match_history insert.
+    """
+    cursor.execute("""
+        INSERT INTO match_stats_suspect
+            (suspect_id, match_count, confidence_sum, confidence_min,
+             confidence_max, last_confidence, last_matched_at)
+        VALUES (%s, 1, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+        ON DUPLICATE KEY UPDATE
+            match_count = match_count + 1,
+            confidence_sum = confidence_sum + VALUES(confidence_sum),
+            confidence_min = LEAST(COALESCE(confidence_min, VALUES(confidence_min)), VALUES(confidence_min)),
+            confidence_max = GREATEST(COALESCE(confidence_max, VALUES(confidence_max)), VALUES(confidence_max)),
+            last_confidence = VALUES(last_confidence),
+            last_matched_at = VALUES(last_matched_at)
+    """, (suspect_id, confidence, confidence, confidence, confidence))
+    
+    cursor.execute("""
+        INSERT INTO match_stats_confidence (bucket, match_count)
+        VALUES (%s, 1)
+        ON DUPLICATE KEY UPDATE match_count = match_count + 1
+    """, (confidence_bucket(confidence),))
+    
+    cursor.execute("""
+        INSERT INTO match_stats_hourly
+            (station, hour_start, match_count, confidence_sum)
+        VALUES (%s, DATE_FORMAT(CURRENT_TIMESTAMP, '%%Y-%%m-%%d %%H:00:00'), 1, %s)
+        ON DUPLICATE KEY UPDATE
+            match_count = match_count + 1,
+            confidence_sum = confidence_sum + VALUES(confidence_sum)
+    """, (station, confidence))
+
 @app.route('/api/no-match', methods=['POST'])
 def no_match_event():
     """
@@ -335,6 +408,183 @@ def list_suspects():
     
     return jsonify(suspects)
 
+# ============================================
+# Match Statistics API
+# Reads come from the counters maintained by update_match_stats,
+# never from a GROUP BY over match_history
+# ============================================
+
+def format_suspect_stats(row):
+    """Add derived fields and make a match_stats_suspect row JSON-friendly"""
+    count = row['match_count']
+    row['confidence_sum'] = int(row['confidence_sum'])
+    row['confidence_avg'] = round(row['confidence_sum'] / count, 1) if count else None
+    if row.get('last_matched_at'):
+        row['last_matched_at'] = row['last_matched_at'].strftime('%Y-%m-%d %H:%M:%S')
+    return row
+
+@app.route('/api/stats/suspects')
+def stats_leaderboard():
+    """
+    Per-suspect match leaderboard, most-matched first.
+    Optional query param: ?limit=<int> (default 10, max 100)
+    """
+    limit = request.args.get('limit', 10, type=int)
+    limit = min(max(limit, 1), 100)
+    
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(
+            """
+            SELECT ms.suspect_id, s.name, ms.match_count, ms.confidence_sum,
+                   ms.confidence_min, ms.confidence_max,
+                   ms.last_confidence, ms.last_matched_at
+              FROM match_stats_suspect ms
+              JOIN suspects s ON s.id = ms.suspect_id
+             ORDER BY ms.match_count DESC, ms.last_matched_at DESC, ms.suspect_id
+             LIMIT %s
+            """,
+            (limit,)
+        )
+        rows = [format_suspect_stats(r) for r in cursor.fetchall()]
+        cursor.close(); conn.close()
+        return jsonify({'success': True, 'suspects': rows})
+    except mysql.connector.Error as err:
+        cursor.close(); conn.close()
+        return jsonify({'error': str(err)}), 500
+
+@app.route('/api/stats/suspect/<int:suspect_id>')
+def stats_suspect(suspect_id):
+    """Match totals for a single suspect"""
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(
+            """
+            SELECT suspect_id, match_count, confidence_sum,
+                   confidence_min, confidence_max,
+                   last_confidence, last_matched_at
+              FROM match_stats_suspect
+             WHERE suspect_id = %s
+            """,
+            (suspect_id,)
+        )
+        row = cursor.fetchone()
+        suspect_exists = True
+        if not row:
+            cursor.execute("SELECT id FROM suspects WHERE id = %s", (suspect_id,))
+            suspect_exists = cursor.fetchone() is not None
+        cursor.close(); conn.close()
+    except mysql.connector.Error as err:
+        cursor.close(); conn.close()
+        return jsonify({'error': str(err)}), 500
+    
+    if not suspect_exists:
+        return jsonify({'error': 'Suspect not found'}), 404
+    
+    if not row:
+        # Suspect exists but no matches logged yet
+        row = {
+            'suspect_id': suspect_id, 'match_count': 0, 'confidence_sum': 0,
+            'confidence_min': None, 'confidence_max': None,
+            'last_confidence': None, 'last_matched_at': None
+        }
+    return jsonify({'success': True, 'stats': format_suspect_stats(row)})
+
+@app.route('/api/stats/confidence')
+def stats_confidence():
+    """
+    Confidence histogram over the 0-255 scale (all buckets, zero-filled).
+    Scores above 255 are counted in the top bucket.
+    """
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT bucket, match_count FROM match_stats_confidence")
+        counts = {r['bucket']: r['match_count'] for r in cursor.fetchall()}
+        cursor.close(); conn.close()
+    except mysql.connector.Error as err:
+        cursor.close(); conn.close()
+        return jsonify({'error': str(err)}), 500
+    
+    buckets = []
+    for b in range(confidence_bucket(CONFIDENCE_MAX) + 1):
+        low = b * CONFIDENCE_BUCKET_WIDTH
+        buckets.append({
+            'min': low,
+            'max': min(low + CONFIDENCE_BUCKET_WIDTH - 1, CONFIDENCE_MAX),
+            'count': counts.get(b, 0)
+        })
+    return jsonify({'success': True, 'bucket_width': CONFIDENCE_BUCKET_WIDTH, 'buckets': buckets})
+
+@app.route('/api/stats/hourly')
+def stats_hourly():
+    """
+    Per-station hourly scan volume over the last <hours> hours.
+    Optional query params: ?station=<name> (default all), ?hours=<int> (default 24, max 168)
+    Every hour in the window is listed (zero-filled) for each station with
+    matches in the window, or for the requested station even if it has none.
+    """
+    station = request.args.get('station')
+    hours = request.args.get('hours', 24, type=int)
+    hours = min(max(hours, 1), 168)
+    
+    conn = get_db_connection()
+    if not conn:
+        return jsonify({'error': 'Database connection failed'}), 500
+    cursor = conn.cursor(dictionary=True)
+    
+    query = """
+        SELECT station, hour_start, match_count, confidence_sum
+          FROM match_stats_hourly
+         WHERE hour_start >= %s
+    """
+    
+    try:
+        # Use the database clock so the window lines up with matched_at
+        cursor.execute(
+            """
+            SELECT CAST(DATE_FORMAT(CURRENT_TIMESTAMP - INTERVAL %s HOUR,
+                                    '%%Y-%%m-%%d %%H:00:00') AS DATETIME) AS window_start
+            """,
+            (hours - 1,)
+        )
+        window_start = cursor.fetchone()['window_start']
+        
+        params = [window_start]
+        if station:
+            query += " AND station = %s"
+            params.append(station)
+        cursor.execute(query, tuple(params))
+        rows = cursor.fetchall()
+        cursor.close(); conn.close()
+    except mysql.connector.Error as err:
+        cursor.close(); conn.close()
+        return jsonify({'error': str(err)}), 500
+    
+    counts = {(r['station'], r['hour_start']): r for r in rows}
+    stations = [station] if station else sorted({r['station'] for r in rows})
+    window = [window_start + timedelta(hours=h) for h in range(hours)]
+    
+    buckets = []
+    for name in stations:
+        for hour_start in window:
+            r = counts.get((name, hour_start))
+            buckets.append({
+                'station': name,
+                'hour_start': hour_start.strftime('%Y-%m-%d %H:00'),
+                'match_count': r['match_count'] if r else 0,
+                'confidence_sum': int(r['confidence_sum']) if r else 0
+            })
+    return jsonify({'success': True, 'hours': hours, 'buckets': buckets})
+
 # ============================================
 # WebSocket Events
 # ============================================